@@ -1,19 +1,97 @@
+import json
+import os
 from functools import lru_cache
-from typing import List
+from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+
+class DbProfile(BaseModel):
+    """Read/write options applied to database operations using this profile."""
+
+    read_preference: Literal[
+        "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+    ] = "primary"
+    max_staleness_seconds: Optional[int] = Field(default=None, ge=90)
+    read_concern: Optional[Literal["local", "available", "majority", "linearizable"]] = None
+    write_w: Optional[Union[int, str]] = None
+    write_journal: Optional[bool] = None
+    write_timeout_ms: Optional[int] = Field(default=None, ge=0)
+
+    @model_validator(mode="after")
+    def _check_staleness(self) -> "DbProfile":
+        if self.max_staleness_seconds is not None and self.read_preference == "primary":
+            raise ValueError("max_staleness_seconds cannot be used with primary reads")
+        return self
+
+
+def default_db_profiles() -> Dict[str, DbProfile]:
+    """Built-in operation profiles; DB_PROFILES entries override these by name."""
+    return {
+        # Driver defaults: primary reads, server default write concern
+        "default": DbProfile(),
+        # Listing/export/stats reads may lag slightly to offload the primary
+        "listing": DbProfile(
+            read_preference="secondaryPreferred", max_staleness_seconds=90
+        ),
+        # High-volume quote ingest favours latency over durability
+        "quote_ingest": DbProfile(write_w=1),
+        # Accounts must survive failover and be readable right after signup
+        "users": DbProfile(read_concern="majority", write_w="majority"),
+    }
 
 
 class Settings(BaseModel):
     mongo_url: str = Field(default="mongodb://localhost:27017", alias="MONGO_URL")
     mongo_db: str = Field(default="fastapi_db", alias="MONGO_DB")
     allowed_origins: List[str] = Field(default_factory=lambda: ["*"])
+    db_profiles: Dict[str, DbProfile] = Field(
+        default_factory=default_db_profiles, alias="DB_PROFILES"
+    )
+
+    # Serving: "development" runs a single auto-reloading worker,
+    # "production" runs multiple uvloop/httptools workers
+    server_mode: Literal["development", "production"] = Field(
+        default="development", alias="SERVER_MODE"
+    )
+    host: str = Field(default="0.0.0.0", alias="HOST")
+    port: int = Field(default=8001, alias="PORT")
+    web_concurrency: Optional[int] = Field(default=None, ge=1, alias="WEB_CONCURRENCY")
+    keepalive_timeout: int = Field(default=5, ge=1, alias="KEEPALIVE_TIMEOUT")
+    backlog: int = Field(default=2048, ge=1, alias="BACKLOG")
+    graceful_shutdown_timeout: int = Field(
+        default=8, ge=0, alias="GRACEFUL_SHUTDOWN_TIMEOUT"
+    )
+
+    # Logging: successful requests are sampled, errors and slow ones always kept
+    log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    log_queue_size: int = Field(default=10000, ge=1, alias="LOG_QUEUE_SIZE")
+    access_log_sample_rate: float = Field(
+        default=1.0, ge=0.0, le=1.0, alias="ACCESS_LOG_SAMPLE_RATE"
+    )
+    slow_request_ms: float = Field(default=1000.0, ge=0.0, alias="SLOW_REQUEST_MS")
+
+    # Debug profiling: the middleware is only installed when enabled
+    profiling_enabled: bool = Field(default=False, alias="PROFILING_ENABLED")
+    profile_token: str = Field(default="", alias="PROFILE_TOKEN")
+    profile_sample_rate: float = Field(
+        default=0.0, ge=0.0, le=1.0, alias="PROFILE_SAMPLE_RATE"
+    )
+    profile_dir: str = Field(default="profiles", alias="PROFILE_DIR")
 
     class Config:
         populate_by_name = True
 
+    @field_validator("db_profiles", mode="before")
+    @classmethod
+    def _merge_db_profiles(cls, value):
+        # DB_PROFILES arrives as a JSON object string when read from the environment
+        if isinstance(value, str):
+            value = json.loads(value)
+        return {**default_db_profiles(), **value}
+
 
 @lru_cache
 def get_settings() -> Settings:
     """Return cached app settings loaded from environment variables."""
-    return Settings()  # Environment variables override defaults
+    return Settings.model_validate(os.environ)  # Environment variables override defaults
@@ -0,0 +1,183 @@
+import json
+import logging
+import queue
+import random
+import sys
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from pymongo import monitoring
+
+from ..config import Settings
+
+# Per-request state; Motor copies the context into its executor threads, so the
+# command listener below sees the same RequestStats object as the request task
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+request_stats_var: ContextVar[Optional["RequestStats"]] = ContextVar(
+    "request_stats", default=None
+)
+
+access_logger = logging.getLogger("app.access")
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_RESERVED = set(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
+class RequestStats:
+    """Mutable timings collected while a request is being served."""
+
+    __slots__ = ("mongo_ms",)
+
+    def __init__(self) -> None:
+        self.mongo_ms = 0.0
+
+
+class MongoTimingListener(monitoring.CommandListener):
+    """Accumulate MongoDB command time onto the current request."""
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._record(event.duration_micros)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._record(event.duration_micros)
+
+    @staticmethod
+    def _record(duration_micros: int) -> None:
+        stats = request_stats_var.get()
+        if stats is not None:
+            stats.mongo_ms += duration_micros / 1000
+
+
+class JsonFormatter(logging.Formatter):
+    """Render log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and value is not None:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the caller and defers formatting.
+
+    Records are tagged with the current request id and handed to the listener
+    thread as-is; if the queue is full the record is dropped and counted.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.request_id = getattr(record, "request_id", None) or request_id_var.get()
+        # Merge args now so they cannot change before the listener formats them
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(settings: Settings) -> QueueListener:
+    """Route the "app" loggers through a queue to a background JSON writer.
+
+    Returns the started listener; call ``stop()`` on shutdown to flush it.
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter())
+    listener = QueueListener(log_queue, stream, respect_handler_level=False)
+
+    logger = logging.getLogger("app")
+    for handler in list(logger.handlers):
+        if isinstance(handler, NonBlockingQueueHandler):
+            logger.removeHandler(handler)
+    logger.addHandler(NonBlockingQueueHandler(log_queue))
+    logger.setLevel(settings.log_level)
+    logger.propagate = False
+
+    listener.start()
+    return listener
+
+
+class AccessLogMiddleware:
+    """ASGI middleware emitting one structured access log line per request."""
+
+    def __init__(self, app, sample_rate: float = 1.0, slow_ms: float = 1000.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:128]
+                break
+        request_id = request_id or uuid.uuid4().hex
+
+        stats = RequestStats()
+        id_token = request_id_var.set(request_id)
+        stats_token = request_stats_var.set(stats)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", ()))
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            latency_ms = (time.perf_counter() - started) * 1000
+            if (
+                status_code >= 400
+                or latency_ms >= self.slow_ms
+                or random.random() < self.sample_rate
+            ):
+                route = scope.get("route")
+                access_logger.log(
+                    logging.ERROR if status_code >= 500 else logging.INFO,
+                    "request",
+                    extra={
+                        "request_id": request_id,
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "route": getattr(route, "path", None),
+                        "status": status_code,
+                        "latency_ms": round(latency_ms, 2),
+                        "mongo_ms": round(stats.mongo_ms, 2),
+                    },
+                )
+            request_id_var.reset(id_token)
+            request_stats_var.reset(stats_token)
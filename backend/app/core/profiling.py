@@ -0,0 +1,170 @@
+import asyncio
+import cProfile
+import hmac
+import io
+import logging
+import os
+import pstats
+import random
+import time
+import uuid
+from typing import Optional
+
+logger = logging.getLogger("app.profiling")
+
+# cProfile hooks the whole thread, so only one request per process may be
+# profiled at a time; overlapping requests are served unprofiled
+_profile_in_progress = False
+
+
+class LoopLagMonitor:
+    """Measure how long the event loop was blocked while a request ran.
+
+    A ticker sleeps for ``interval`` seconds; any overshoot beyond that is
+    time during which the loop could not run callbacks.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.blocked_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _tick(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - started - self.interval
+            if lag > 0:
+                self.blocked_ms += lag * 1000
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._tick())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+def _render_stats(profiler: cProfile.Profile, limit: int = 50) -> str:
+    """Render the hottest functions of a profile as a text report."""
+    buffer = io.StringIO()
+    pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(limit)
+    return buffer.getvalue()
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling opted-in requests with cProfile.
+
+    A request is profiled when it sends ``header_name`` with the configured
+    token, or when it is picked by ``sample_rate``. The profile is written to
+    ``output_dir`` as a pstats file (named in the ``X-Profile-File`` response
+    header), or, for token-authenticated requests that also send
+    ``X-Profile-Output: inline``, returned as a text report instead of the
+    response body. Sampled requests always keep their original body.
+
+    cProfile sees the whole event-loop thread, so concurrent requests show up
+    in the profile too; use this on a quiet instance.
+    """
+
+    def __init__(
+        self,
+        app,
+        token: str = "",
+        header_name: str = "x-profile",
+        sample_rate: float = 0.0,
+        output_dir: str = "profiles",
+    ) -> None:
+        self.app = app
+        self.token = token
+        self.header_name = header_name.lower().encode("latin-1")
+        self.sample_rate = sample_rate
+        self.output_dir = output_dir
+
+    def _requested(self, headers: dict) -> bool:
+        supplied = headers.get(self.header_name)
+        if supplied is not None and self.token:
+            return hmac.compare_digest(supplied, self.token.encode("latin-1"))
+        return False
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        global _profile_in_progress
+
+        headers = dict(scope.get("headers", ()))
+        requested = self._requested(headers)
+        if _profile_in_progress or not (
+            requested or random.random() < self.sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        inline = requested and headers.get(b"x-profile-output") == b"inline"
+        messages = []
+
+        async def buffer_send(message) -> None:
+            messages.append(message)
+
+        monitor = LoopLagMonitor()
+        profiler = cProfile.Profile()
+        _profile_in_progress = True
+        try:
+            monitor.start()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, buffer_send)
+            finally:
+                profiler.disable()
+                await monitor.stop()
+        finally:
+            _profile_in_progress = False
+
+        # Never derive the file name from client input such as X-Request-ID
+        profile_name = f"{uuid.uuid4().hex}.pstats"
+        extra_headers = [
+            (b"x-profile-loop-blocked-ms", f"{monitor.blocked_ms:.2f}".encode()),
+        ]
+        if inline:
+            report = await asyncio.to_thread(_render_stats, profiler)
+            start = next(m for m in messages if m["type"] == "http.response.start")
+            extra_headers.append((b"x-profile-status", str(start["status"]).encode()))
+            body = report.encode()
+            messages = [
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"text/plain; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                },
+                {"type": "http.response.body", "body": body},
+            ]
+        else:
+            path = os.path.join(self.output_dir, profile_name)
+            await asyncio.to_thread(os.makedirs, self.output_dir, exist_ok=True)
+            await asyncio.to_thread(profiler.dump_stats, path)
+            extra_headers.append((b"x-profile-file", profile_name.encode()))
+
+        logger.info(
+            "profiled request",
+            extra={
+                "path": scope["path"],
+                "profile": None if inline else profile_name,
+                "loop_blocked_ms": round(monitor.blocked_ms, 2),
+            },
+        )
+
+        for message in messages:
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": list(message.get("headers", ())) + extra_headers,
+                }
+            await send(message)
@@ -1,13 +1,78 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+import logging
+from typing import Dict
 
-from .config import get_settings
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import WriteConcern
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
 
+from .config import DbProfile, get_settings
+from .core.logs import MongoTimingListener
+
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
-client = AsyncIOMotorClient(settings.mongo_url)
+client = AsyncIOMotorClient(settings.mongo_url, event_listeners=[MongoTimingListener()])
 db = client[settings.mongo_db]
 
+_profile_dbs: Dict[str, AsyncIOMotorDatabase] = {}
+
+
+def profile_options(profile: DbProfile) -> dict:
+    """Translate a DbProfile into driver keyword arguments for get_database()."""
+    options = {
+        "read_preference": make_read_preference(
+            read_pref_mode_from_name(profile.read_preference),
+            None,
+            max_staleness=profile.max_staleness_seconds or -1,
+        ),
+    }
+    if profile.read_concern is not None:
+        options["read_concern"] = ReadConcern(profile.read_concern)
+    write_options = (profile.write_w, profile.write_journal, profile.write_timeout_ms)
+    if any(option is not None for option in write_options):
+        options["write_concern"] = WriteConcern(
+            w=profile.write_w,
+            j=profile.write_journal,
+            wtimeout=profile.write_timeout_ms,
+        )
+    return options
+
+
+def get_db(profile: str = "default") -> AsyncIOMotorDatabase:
+    """Return the database handle configured for a named operation profile."""
+    handle = _profile_dbs.get(profile)
+    if handle is None:
+        options = profile_options(settings.db_profiles[profile])
+        handle = client.get_database(settings.mongo_db, **options)
+        _profile_dbs[profile] = handle
+    return handle
+
 
 async def ping() -> None:
     """Ping MongoDB to confirm connectivity."""
     await db.command("ping")
+
+
+async def ensure_indexes() -> None:
+    """Create the indexes the API relies on (no-op if they already exist).
+
+    Best-effort: failures are logged and the API keeps serving, so a MongoDB
+    outage surfaces through /health rather than crashing workers at startup.
+    """
+    try:
+        await db.quotes.create_index("updatedAt")
+        # Back the quotes grid: its createdAt sort alone and with each filter
+        await db.quotes.create_index([("createdAt", -1), ("_id", -1)])
+        await db.quotes.create_index([("status", 1), ("createdAt", -1), ("_id", -1)])
+        await db.quotes.create_index(
+            [("serviceType", 1), ("createdAt", -1), ("_id", -1)]
+        )
+    except Exception:
+        logger.exception("Failed to create MongoDB indexes")
+
+
+def close() -> None:
+    """Close the MongoDB client and its connection pool."""
+    client.close()
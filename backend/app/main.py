@@ -1,13 +1,31 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import get_settings
-from .db import ping
+from .core.logs import AccessLogMiddleware, configure_logging
+from .core.profiling import ProfilingMiddleware
+from .db import close, ensure_indexes, ping
 from .routers import auth, quotes, users
 
 settings = get_settings()
+log_listener = configure_logging(settings)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # In the background so startup never waits on MongoDB server selection
+    indexes = asyncio.create_task(ensure_indexes())
+    yield
+    indexes.cancel()
+    # Runs after uvicorn has drained in-flight requests
+    close()
+    log_listener.stop()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,6 +34,18 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.profiling_enabled:
+    app.add_middleware(
+        ProfilingMiddleware,
+        token=settings.profile_token,
+        sample_rate=settings.profile_sample_rate,
+        output_dir=settings.profile_dir,
+    )
+app.add_middleware(
+    AccessLogMiddleware,
+    sample_rate=settings.access_log_sample_rate,
+    slow_ms=settings.slow_request_ms,
+)
 
 
 @app.get("/")
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Iterable, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -13,6 +13,36 @@ class QuoteStatus(str, Enum):
     CANCELLED = "CANCELLED"
 
 
+# Allowed status moves; COMPLETED and CANCELLED are terminal
+STATUS_TRANSITIONS = {
+    QuoteStatus.SUBMITTED: {QuoteStatus.PENDING, QuoteStatus.CANCELLED},
+    QuoteStatus.PENDING: {QuoteStatus.IN_PROGRESS, QuoteStatus.CANCELLED},
+    QuoteStatus.IN_PROGRESS: {QuoteStatus.COMPLETED, QuoteStatus.CANCELLED},
+    QuoteStatus.COMPLETED: set(),
+    QuoteStatus.CANCELLED: set(),
+}
+
+
+def can_transition(current: QuoteStatus, target: QuoteStatus) -> bool:
+    """Return True if a quote may move from current to target status."""
+    return target in STATUS_TRANSITIONS[current]
+
+
+# Stored document keys a client may request via projection
+QUOTE_FIELDS = frozenset(
+    {
+        "name",
+        "phone",
+        "address",
+        "serviceType",
+        "status",
+        "createdAt",
+        "updatedAt",
+        "description",
+    }
+)
+
+
 class QuoteRequest(BaseModel):
     name: str = Field(..., min_length=2)
     phone: str = Field(..., min_length=1)
@@ -29,6 +59,35 @@ class QuoteResponse(BaseModel):
     message: str
 
 
+class QuoteBatchGetRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=100)
+    fields: Optional[List[str]] = None
+
+
+class QuoteStatusUpdate(BaseModel):
+    status: QuoteStatus
+    expected_status: QuoteStatus = Field(..., alias="expectedStatus")
+
+    class Config:
+        populate_by_name = True
+
+
+class QuoteStatusBulkItem(QuoteStatusUpdate):
+    id: str
+
+
+class QuoteStatusBulkRequest(BaseModel):
+    updates: List[QuoteStatusBulkItem] = Field(..., min_length=1, max_length=100)
+
+
+class QuoteStatusResult(BaseModel):
+    id: str
+    result: Literal["updated", "conflict", "invalid_transition", "invalid_id"]
+
+
+# Stored quote documents may also carry internal fields that are not exposed:
+#   statusBatchId (ObjectId) - id of the last POST /api/quotes/status:bulk
+#   request that changed the status; used to report which writes applied
 class QuoteDTO(BaseModel):
     id: str
     name: str
@@ -37,6 +96,7 @@ class QuoteDTO(BaseModel):
     service_type: str = Field(..., alias="serviceType")
     status: Optional[QuoteStatus] = None
     created_at: Optional[datetime] = Field(None, alias="createdAt")
+    updated_at: Optional[datetime] = Field(None, alias="updatedAt")
     description: Optional[str] = None
 
     class Config:
@@ -49,3 +109,12 @@ def serialize_quote(document: dict) -> QuoteDTO:
     document["id"] = str(document.get("_id"))
     document.pop("_id", None)
     return QuoteDTO.model_validate(document)
+
+
+def project_quote(document: dict, fields: Iterable[str]) -> dict:
+    """Build a partial quote payload from a projected MongoDB document."""
+    projected = {"id": str(document.get("_id"))}
+    for field in fields:
+        if field in document:
+            projected[field] = document[field]
+    return projected
@@ -1,10 +1,13 @@
+import logging
+
 from fastapi import APIRouter, HTTPException
 
 from ..core.security import create_access_token, verify_password
-from ..db import db
+from ..db import get_db
 from ..models.user import Token, UserLogin
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
+logger = logging.getLogger(__name__)
 
 
 @router.post("/login", response_model=Token)
@@ -12,7 +15,7 @@ async def login(credentials: UserLogin) -> Token:
     """Authenticate user with email and password, return JWT token."""
     try:
         # Find user by email
-        user = await db.users.find_one({"email": credentials.email})
+        user = await get_db("users").users.find_one({"email": credentials.email})
         
         if not user:
             raise HTTPException(
@@ -34,6 +37,7 @@ async def login(credentials: UserLogin) -> Token:
     except HTTPException:
         raise
     except Exception as exc:  # pragma: no cover
+        logger.exception("Login failed")
         raise HTTPException(status_code=500, detail=f"Login failed: {exc}")
 
 # Registration route removed as requested
@@ -1,11 +1,30 @@
+import logging
+import re
 from datetime import datetime
+from typing import Literal, Optional
 
+from bson import ObjectId
+from bson.errors import InvalidId
 from fastapi import APIRouter, HTTPException, Query
+from pymongo import ReturnDocument, UpdateOne
 
-from ..db import db
-from ..models.quote import QuoteRequest, QuoteResponse, QuoteStatus, serialize_quote
+from ..db import get_db
+from ..models.quote import (
+    QUOTE_FIELDS,
+    QuoteBatchGetRequest,
+    QuoteRequest,
+    QuoteResponse,
+    QuoteStatus,
+    QuoteStatusBulkRequest,
+    QuoteStatusResult,
+    QuoteStatusUpdate,
+    can_transition,
+    project_quote,
+    serialize_quote,
+)
 
 router = APIRouter(prefix="/api/quotes", tags=["quotes"])
+logger = logging.getLogger(__name__)
 
 
 @router.post("", response_model=QuoteResponse)
@@ -13,16 +32,17 @@ async def create_quote(quote: QuoteRequest) -> QuoteResponse:
     """Create a new quote request and persist it to MongoDB."""
     try:
         quote_doc = quote.model_dump(by_alias=True)
-        quote_doc["createdAt"] = datetime.utcnow()
+        quote_doc["createdAt"] = quote_doc["updatedAt"] = datetime.utcnow()
         quote_doc["status"] = QuoteStatus.PENDING.value
 
-        result = await db.quotes.insert_one(quote_doc)
+        result = await get_db("quote_ingest").quotes.insert_one(quote_doc)
 
         return QuoteResponse(
             id=str(result.inserted_id),
             message="Quote request submitted successfully",
         )
     except Exception as exc:  # pragma: no cover - defensive barrier
+        logger.exception("Failed to create quote")
         raise HTTPException(status_code=500, detail=f"Failed to create quote: {exc}")
 
 
@@ -30,17 +50,50 @@ async def create_quote(quote: QuoteRequest) -> QuoteResponse:
 async def get_quotes(
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    sort: Literal["createdAt"] = Query("createdAt", description="Field to sort by"),
+    order: Literal["asc", "desc"] = Query("desc", description="Sort direction"),
+    status: Optional[QuoteStatus] = Query(None, description="Only this status"),
+    service_type: Optional[str] = Query(
+        None, alias="serviceType", max_length=100, description="Only this service type"
+    ),
+    name: Optional[str] = Query(
+        None,
+        min_length=1,
+        max_length=100,
+        description="Name contains (case-insensitive)",
+    ),
 ) -> dict:
-    """Retrieve paginated quote requests sorted by creation date (desc)."""
+    """Retrieve paginated quote requests, sorted and filtered server-side.
+
+    Sorting is limited to createdAt so every status/serviceType combination is
+    served by a (filter, createdAt, _id) index. The ``name`` filter is an
+    unanchored case-insensitive regex and always scans the matching set, so
+    combine it with an indexed filter on large collections.
+    """
     try:
         skip = (page - 1) * limit
+        collection = get_db("listing").quotes
+
+        query = {}
+        if status is not None:
+            query["status"] = status.value
+        if service_type is not None:
+            query["serviceType"] = service_type
+        if name is not None:
+            query["name"] = {"$regex": re.escape(name), "$options": "i"}
         
         # Get total count for pagination metadata
-        total_count = await db.quotes.count_documents({})
+        total_count = await collection.count_documents(query)
         
-        # Fetch paginated quotes
+        # Fetch paginated quotes; _id breaks ties so pages never overlap
+        direction = 1 if order == "asc" else -1
         quotes = []
-        cursor = db.quotes.find().sort("createdAt", -1).skip(skip).limit(limit)
+        cursor = (
+            collection.find(query)
+            .sort([(sort, direction), ("_id", direction)])
+            .skip(skip)
+            .limit(limit)
+        )
         async for document in cursor:
             quotes.append(serialize_quote(document).model_dump(by_alias=True))
 
@@ -58,4 +111,177 @@ async def get_quotes(
             },
         }
     except Exception as exc:  # pragma: no cover - defensive barrier
+        logger.exception("Failed to fetch quotes")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch quotes: {exc}")
+
+
+@router.post("/batch-get")
+async def batch_get_quotes(payload: QuoteBatchGetRequest) -> dict:
+    """Resolve many quotes by id with a single query, preserving input order."""
+    # One conversion pass: validates, normalises hex case and dedupes in order
+    oids = {}
+    invalid = []
+    for quote_id in payload.ids:
+        try:
+            oids.setdefault(ObjectId(quote_id))
+        except InvalidId:
+            invalid.append(quote_id)
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid quote ids: {invalid}")
+
+    projection = None
+    if payload.fields is not None:
+        unknown = sorted(set(payload.fields) - QUOTE_FIELDS)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {unknown}")
+        projection = {field: 1 for field in payload.fields}
+
+    try:
+        found = {}
+        # By-id lookups read from the primary so just-created quotes resolve
+        cursor = get_db().quotes.find({"_id": {"$in": list(oids)}}, projection)
+        async for document in cursor:
+            if projection is None:
+                quote = serialize_quote(document).model_dump(by_alias=True)
+            else:
+                quote = project_quote(document, payload.fields)
+            found[document["_id"]] = quote
+
+        return {
+            "quotes": [found[oid] for oid in oids if oid in found],
+            "missing": [str(oid) for oid in oids if oid not in found],
+        }
+    except Exception as exc:  # pragma: no cover - defensive barrier
+        logger.exception("Failed to fetch quotes")
         raise HTTPException(status_code=500, detail=f"Failed to fetch quotes: {exc}")
+
+
+@router.get("/{quote_id}")
+async def get_quote(quote_id: str) -> dict:
+    """Retrieve a single quote request by id."""
+    if not ObjectId.is_valid(quote_id):
+        raise HTTPException(status_code=400, detail="Invalid quote id")
+
+    try:
+        document = await get_db().quotes.find_one({"_id": ObjectId(quote_id)})
+        if not document:
+            raise HTTPException(status_code=404, detail="Quote not found")
+
+        return serialize_quote(document).model_dump(by_alias=True)
+    except HTTPException:
+        raise
+    except Exception as exc:  # pragma: no cover - defensive barrier
+        logger.exception("Failed to fetch quote")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch quote: {exc}")
+
+
+@router.patch("/{quote_id}/status")
+async def update_quote_status(quote_id: str, payload: QuoteStatusUpdate) -> dict:
+    """Move a quote to a new status if it is still in the expected status."""
+    if not ObjectId.is_valid(quote_id):
+        raise HTTPException(status_code=400, detail="Invalid quote id")
+    if not can_transition(payload.expected_status, payload.status):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot move quote from {payload.expected_status.value} "
+            f"to {payload.status.value}",
+        )
+
+    try:
+        collection = get_db().quotes
+        document = await collection.find_one_and_update(
+            {"_id": ObjectId(quote_id), "status": payload.expected_status.value},
+            {"$set": {"status": payload.status.value, "updatedAt": datetime.utcnow()}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if not document:
+            # Either the quote does not exist or someone changed it first
+            if not await collection.find_one({"_id": ObjectId(quote_id)}, {"_id": 1}):
+                raise HTTPException(status_code=404, detail="Quote not found")
+            raise HTTPException(status_code=409, detail="Quote status has changed")
+
+        return serialize_quote(document).model_dump(by_alias=True)
+    except HTTPException:
+        raise
+    except Exception as exc:  # pragma: no cover - defensive barrier
+        logger.exception("Failed to update quote")
+        raise HTTPException(status_code=500, detail=f"Failed to update quote: {exc}")
+
+
+@router.post("/status:bulk")
+async def bulk_update_quote_status(payload: QuoteStatusBulkRequest) -> dict:
+    """Apply many status transitions in one unordered bulk write.
+
+    Each applied write stamps the quote with this request's ``statusBatchId``.
+    When not every write matches, a follow-up query on that marker decides
+    which ones applied. If another request changes the same quote again in
+    between, the marker is overwritten and the write is reported as
+    "conflict" even though it did apply.
+    """
+    # Canonical lowercase hex so ids compare equal to str(document["_id"])
+    updates = [
+        (str(ObjectId(item.id)) if ObjectId.is_valid(item.id) else item.id, item)
+        for item in payload.updates
+    ]
+    ids = [quote_id for quote_id, _ in updates]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Duplicate quote ids in request")
+
+    try:
+        now = datetime.utcnow()
+        # Unique per batch, so the follow-up query only sees this batch's writes
+        batch_id = ObjectId()
+        results = {}
+        operations = []
+        for quote_id, item in updates:
+            if not ObjectId.is_valid(quote_id):
+                results[quote_id] = "invalid_id"
+            elif not can_transition(item.expected_status, item.status):
+                results[quote_id] = "invalid_transition"
+            else:
+                operations.append(
+                    UpdateOne(
+                        {"_id": ObjectId(quote_id), "status": item.expected_status.value},
+                        {
+                            "$set": {
+                                "status": item.status.value,
+                                "updatedAt": now,
+                                "statusBatchId": batch_id,
+                            }
+                        },
+                    )
+                )
+
+        pending = {
+            quote_id: item.status.value
+            for quote_id, item in updates
+            if quote_id not in results
+        }
+        if operations:
+            outcome = await get_db().quotes.bulk_write(operations, ordered=False)
+            if outcome.matched_count == len(operations):
+                applied = set(pending)
+            else:
+                # Bulk results are aggregate only; find the writes that landed
+                # by this batch's marker
+                cursor = get_db().quotes.find(
+                    {
+                        "_id": {"$in": [ObjectId(quote_id) for quote_id in pending]},
+                        "statusBatchId": batch_id,
+                    },
+                    {"_id": 1},
+                )
+                applied = {str(document["_id"]) async for document in cursor}
+            for quote_id in pending:
+                results[quote_id] = "updated" if quote_id in applied else "conflict"
+
+        return {
+            "results": [
+                QuoteStatusResult(id=quote_id, result=results[quote_id]).model_dump()
+                for quote_id in ids
+            ],
+            "updated": sum(1 for result in results.values() if result == "updated"),
+        }
+    except Exception as exc:  # pragma: no cover - defensive barrier
+        logger.exception("Failed to update quotes")
+        raise HTTPException(status_code=500, detail=f"Failed to update quotes: {exc}")
@@ -1,10 +1,13 @@
+import logging
+
 from fastapi import APIRouter, HTTPException, status
 
 from ..core.security import hash_password
-from ..db import db
+from ..db import get_db
 from ..models.user import UserCreate, UserResponse
 
 router = APIRouter(prefix="/api/users", tags=["users"])
+logger = logging.getLogger(__name__)
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -12,12 +15,12 @@ async def create_user(payload: UserCreate) -> UserResponse:
     """Create a new user with email and password (hashed)."""
     try:
         # Ensure unique email
-        existing = await db.users.find_one({"email": payload.email})
+        existing = await get_db("users").users.find_one({"email": payload.email})
         if existing:
             raise HTTPException(status_code=400, detail="Email already in use")
 
         hashed = hash_password(payload.password)
-        result = await db.users.insert_one({
+        result = await get_db("users").users.insert_one({
             "email": payload.email,
             "hashed_password": hashed,
         })
@@ -26,4 +29,5 @@ async def create_user(payload: UserCreate) -> UserResponse:
     except HTTPException:
         raise
     except Exception as exc:  # pragma: no cover
+        logger.exception("User creation failed")
         raise HTTPException(status_code=500, detail=f"User creation failed: {exc}")
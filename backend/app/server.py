@@ -0,0 +1,86 @@
+import math
+import os
+from typing import Optional
+
+import uvicorn
+
+from .config import Settings, get_settings
+
+# cgroup v2 and v1 locations of the container CPU quota
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path) as handle:
+            return handle.read().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit() -> Optional[int]:
+    """Return the CPU quota (docker --cpus, k8s limits) rounded up, if any."""
+    cpu_max = _read(CGROUP_V2_CPU_MAX)
+    if cpu_max is not None:
+        quota, _, period = cpu_max.partition(" ")
+    else:
+        quota, period = _read(CGROUP_V1_QUOTA), _read(CGROUP_V1_PERIOD)
+    try:
+        quota_us, period_us = int(quota), int(period)
+    except (TypeError, ValueError):  # "max" or no cgroup files: unlimited
+        return None
+    if quota_us <= 0 or period_us <= 0:
+        return None
+    return max(1, math.ceil(quota_us / period_us))
+
+
+def worker_count(settings: Settings) -> int:
+    """Return the number of worker processes to run in production."""
+    if settings.web_concurrency:
+        return settings.web_concurrency
+    try:
+        # Respect CPU affinity / cpuset limits inside containers
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+    # ...and CPU quotas, which the affinity mask does not reflect
+    limit = cgroup_cpu_limit()
+    return min(cpus, limit) if limit else cpus
+
+
+def uvicorn_options(settings: Settings) -> dict:
+    """Build uvicorn.run() keyword arguments for the configured server mode."""
+    options = {
+        "host": settings.host,
+        "port": settings.port,
+    }
+    if settings.server_mode == "development":
+        options["reload"] = True
+        return options
+
+    # Workers are spawned (not forked), so each one imports app.db afresh and
+    # builds its own Motor client; the lifespan hook closes it on shutdown.
+    options.update(
+        workers=worker_count(settings),
+        # uvloop when installed (it is skipped on Windows), else asyncio
+        loop="auto",
+        http="httptools",
+        timeout_keep_alive=settings.keepalive_timeout,
+        backlog=settings.backlog,
+        timeout_graceful_shutdown=settings.graceful_shutdown_timeout,
+        proxy_headers=True,
+        # Structured access logs come from AccessLogMiddleware instead
+        access_log=False,
+    )
+    return options
+
+
+def main() -> None:
+    """Run the API with uvicorn using the configured server mode."""
+    uvicorn.run("app.main:app", **uvicorn_options(get_settings()))
+
+
+if __name__ == "__main__":
+    main()
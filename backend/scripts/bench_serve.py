@@ -0,0 +1,158 @@
+"""Compare API throughput of the development and production serving modes.
+
+Starts each server command in turn, drives it with a multi-process HTTP load
+generator, and prints requests/second and latency percentiles.
+
+Run from the backend directory (no MongoDB needed for the default ``/`` path):
+
+    # Old command (uvicorn --reload, single worker) vs. production mode
+    python scripts/bench_serve.py --mode both --duration 20 --concurrency 128
+
+    # Only one side, e.g. with a fixed worker count
+    WEB_CONCURRENCY=4 python scripts/bench_serve.py --mode production
+
+    # Drive an already running server (e.g. from a separate load host)
+    python scripts/bench_serve.py --url http://api-host:8001/ --duration 30
+
+The load generator competes with the server for CPU when both run on one
+machine; use a multi-core host and ``--clients`` below the core count, or
+``--url`` from another machine, to see the multi-worker gain.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS = {
+    # The command the Dockerfile ran before production mode existed
+    "development": lambda port: [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port), "--reload",
+    ],
+    "production": lambda port: [sys.executable, "-m", "app.server"],
+}
+
+
+async def _drive(url: str, concurrency: int, duration: float) -> list:
+    """Issue requests for ``duration`` seconds; return per-request latencies."""
+    latencies = []
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get(url)
+                if response.status_code == 200:
+                    latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def _client_process(url: str, concurrency: int, duration: float, results) -> None:
+    results.put(asyncio.run(_drive(url, concurrency, duration)))
+
+
+def run_load(url: str, clients: int, concurrency: int, duration: float) -> dict:
+    """Run the load generator across ``clients`` processes and summarise it."""
+    results = multiprocessing.Queue()
+    per_client = max(1, concurrency // clients)
+    processes = [
+        multiprocessing.Process(
+            target=_client_process, args=(url, per_client, duration, results)
+        )
+        for _ in range(clients)
+    ]
+    for process in processes:
+        process.start()
+    latencies = [latency for _ in processes for latency in results.get()]
+    for process in processes:
+        process.join()
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0] * 99
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / duration,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+    }
+
+
+def _wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    raise RuntimeError(f"Server at {url} did not become ready")
+
+
+def bench_mode(mode: str, args: argparse.Namespace) -> dict:
+    """Start the server for ``mode``, load it, and stop it gracefully."""
+    env = {**os.environ, "SERVER_MODE": mode, "HOST": "127.0.0.1", "PORT": str(args.port)}
+    server = subprocess.Popen(
+        COMMANDS[mode](args.port),
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    url = f"http://127.0.0.1:{args.port}{args.path}"
+    try:
+        _wait_ready(url)
+        run_load(url, args.clients, args.concurrency, min(3.0, args.duration))  # warm-up
+        return run_load(url, args.clients, args.concurrency, args.duration)
+    finally:
+        os.killpg(server.pid, signal.SIGTERM)
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["development", "production", "both"], default="both")
+    parser.add_argument("--url", help="Benchmark a running server instead of starting one")
+    parser.add_argument("--path", default="/", help="Request path (default: /)")
+    parser.add_argument("--port", type=int, default=8101)
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds per run")
+    parser.add_argument("--concurrency", type=int, default=64, help="Open connections")
+    parser.add_argument(
+        "--clients",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Load generator processes",
+    )
+    args = parser.parse_args()
+
+    if args.url:
+        runs = {args.url: run_load(args.url, args.clients, args.concurrency, args.duration)}
+    else:
+        modes = ["development", "production"] if args.mode == "both" else [args.mode]
+        runs = {mode: bench_mode(mode, args) for mode in modes}
+
+    print(f"{'target':<40} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'requests':>10}")
+    for target, result in runs.items():
+        print(
+            f"{target:<40} {result['rps']:>10.0f} {result['p50_ms']:>9.2f} "
+            f"{result['p99_ms']:>9.2f} {result['requests']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,10 @@ from app.core.security import hash_password
 class TestAuthRoutes:
     """Test authentication routes."""
 
-    @patch("app.routers.auth.db")
-    async def test_login_success(self, mock_db, client, sample_user):
+    @patch("app.routers.auth.get_db")
+    async def test_login_success(self, mock_get_db, client, sample_user):
         """Successful login should return access token."""
+        mock_db = mock_get_db.return_value
         mock_db.users.find_one = AsyncMock(return_value=sample_user)
         
         response = client.post(
@@ -22,9 +23,10 @@ class TestAuthRoutes:
         assert "access_token" in response.json()
         assert response.json()["token_type"] == "bearer"
 
-    @patch("app.routers.auth.db")
-    async def test_login_invalid_email(self, mock_db, client):
+    @patch("app.routers.auth.get_db")
+    async def test_login_invalid_email(self, mock_get_db, client):
         """Login with non-existent email should return 401."""
+        mock_db = mock_get_db.return_value
         mock_db.users.find_one = AsyncMock(return_value=None)
         
         response = client.post(
@@ -35,9 +37,10 @@ class TestAuthRoutes:
         assert response.status_code == 401
         assert "Invalid email or password" in response.json()["detail"]
 
-    @patch("app.routers.auth.db")
-    async def test_login_invalid_password(self, mock_db, client, sample_user):
+    @patch("app.routers.auth.get_db")
+    async def test_login_invalid_password(self, mock_get_db, client, sample_user):
         """Login with wrong password should return 401."""
+        mock_db = mock_get_db.return_value
         mock_db.users.find_one = AsyncMock(return_value=sample_user)
         
         response = client.post(
@@ -67,9 +70,10 @@ class TestAuthRoutes:
         
         assert response.status_code == 422
 
-    @patch("app.routers.auth.db")
-    async def test_login_database_error(self, mock_db, client):
+    @patch("app.routers.auth.get_db")
+    async def test_login_database_error(self, mock_get_db, client):
         """Login should handle database errors gracefully."""
+        mock_db = mock_get_db.return_value
         mock_db.users.find_one = AsyncMock(side_effect=Exception("DB error"))
         
         response = client.post(
@@ -0,0 +1,93 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import ValidationError
+from pymongo import WriteConcern
+from pymongo.read_preferences import Primary, SecondaryPreferred
+
+from app.config import DbProfile, Settings
+from app.db import ensure_indexes, get_db, profile_options
+
+
+class TestDbProfiles:
+    """Test that operation profiles reach the driver as read/write options."""
+
+    def test_default_profile_uses_primary(self):
+        """The default profile should read from the primary."""
+        assert get_db().read_preference == Primary()
+
+    def test_listing_profile_reads_secondaries(self):
+        """Listings should prefer bounded-staleness secondaries."""
+        handle = get_db("listing")
+
+        assert handle.read_preference == SecondaryPreferred(max_staleness=90)
+        assert handle.quotes.read_preference == SecondaryPreferred(max_staleness=90)
+
+    def test_quote_ingest_profile_uses_w1(self):
+        """Quote ingest should acknowledge writes from the primary only."""
+        assert get_db("quote_ingest").write_concern == WriteConcern(w=1)
+
+    def test_users_profile_uses_majority(self):
+        """User reads and writes should use majority concerns."""
+        handle = get_db("users")
+
+        assert handle.write_concern == WriteConcern(w="majority")
+        assert handle.read_concern.level == "majority"
+
+    def test_handles_are_cached(self):
+        """Each profile should build its database handle once."""
+        assert get_db("listing") is get_db("listing")
+
+    def test_unknown_profile(self):
+        """Selecting a profile that is not configured should fail loudly."""
+        with pytest.raises(KeyError):
+            get_db("missing")
+
+    def test_profiles_override_from_environment(self):
+        """DB_PROFILES JSON should override profiles by name and keep the rest."""
+        settings = Settings.model_validate(
+            {"DB_PROFILES": '{"listing": {"read_preference": "nearest"}}'}
+        )
+
+        assert settings.db_profiles["listing"].read_preference == "nearest"
+        assert settings.db_profiles["users"].write_w == "majority"
+
+    def test_write_timeout_alone_sets_write_concern(self):
+        """A write timeout should produce a write concern on its own."""
+        options = profile_options(DbProfile(write_timeout_ms=500))
+
+        assert options["write_concern"] == WriteConcern(wtimeout=500)
+
+    def test_staleness_requires_secondary_reads(self):
+        """maxStalenessSeconds is not allowed with primary reads."""
+        with pytest.raises(ValidationError):
+            DbProfile(read_preference="primary", max_staleness_seconds=120)
+
+
+@pytest.mark.asyncio
+class TestEnsureIndexes:
+    """Test startup index creation."""
+
+    @patch("app.db.db")
+    async def test_failure_is_logged_not_raised(self, mock_db):
+        """Index creation errors should be logged and swallowed."""
+        mock_db.quotes.create_index = AsyncMock(side_effect=Exception("no mongo"))
+
+        with patch("app.db.logger") as mock_logger:
+            await ensure_indexes()
+
+        mock_logger.exception.assert_called_once()
+
+
+class TestStartup:
+    """Test application startup without MongoDB."""
+
+    @patch("app.db.db")
+    def test_startup_survives_unreachable_mongo(self, mock_db):
+        """The app should start and serve even when index creation fails."""
+        from fastapi.testclient import TestClient
+        from app.main import app
+
+        mock_db.quotes.create_index = AsyncMock(side_effect=Exception("no mongo"))
+        with TestClient(app) as client:
+            assert client.get("/").status_code == 200
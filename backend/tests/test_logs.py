@@ -0,0 +1,140 @@
+import asyncio
+import json
+import logging
+import queue
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from motor.frameworks.asyncio import run_on_executor
+
+from app.core.logs import (
+    AccessLogMiddleware,
+    JsonFormatter,
+    MongoTimingListener,
+    NonBlockingQueueHandler,
+    RequestStats,
+    request_id_var,
+    request_stats_var,
+)
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def access_records():
+    """Capture records emitted on the access logger."""
+    handler = _Capture()
+    logger = logging.getLogger("app.access")
+    logger.addHandler(handler)
+    yield handler.records
+    logger.removeHandler(handler)
+
+
+class TestLoggingPipeline:
+    """Test the structured logging building blocks."""
+
+    def test_json_formatter_includes_extras(self):
+        """Formatter should emit one JSON object with extra fields."""
+        record = logging.makeLogRecord(
+            {"name": "app.access", "levelname": "INFO", "msg": "request", "status": 200}
+        )
+        payload = json.loads(JsonFormatter().format(record))
+
+        assert payload["message"] == "request"
+        assert payload["status"] == 200
+        assert payload["logger"] == "app.access"
+
+    def test_queue_handler_tags_request_id(self):
+        """Queued records should carry the current request id."""
+        log_queue = queue.Queue()
+        handler = NonBlockingQueueHandler(log_queue)
+        token = request_id_var.set("abc123")
+        try:
+            handler.emit(logging.makeLogRecord({"msg": "hello %s", "args": ("world",)}))
+        finally:
+            request_id_var.reset(token)
+
+        record = log_queue.get_nowait()
+        assert record.request_id == "abc123"
+        assert record.msg == "hello world"
+
+    def test_queue_handler_drops_when_full(self):
+        """A full queue should drop records instead of blocking."""
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+        handler.emit(logging.makeLogRecord({"msg": "one"}))
+        handler.emit(logging.makeLogRecord({"msg": "two"}))
+
+        assert handler.dropped == 1
+
+    def test_mongo_listener_accumulates_time(self):
+        """Command durations should add up on the current request."""
+        stats = RequestStats()
+        token = request_stats_var.set(stats)
+        try:
+            listener = MongoTimingListener()
+            listener.succeeded(MagicMock(duration_micros=1500))
+            listener.failed(MagicMock(duration_micros=500))
+        finally:
+            request_stats_var.reset(token)
+
+        assert stats.mongo_ms == 2.0
+
+
+@pytest.mark.asyncio
+class TestAccessLog:
+    """Test the access log middleware."""
+
+    @patch("app.routers.quotes.get_db")
+    async def test_access_log_fields(self, mock_get_db, client, sample_quote, access_records):
+        """Each request should log route, status and latency with a request id."""
+        mock_db = mock_get_db.return_value
+        mock_db.quotes.find_one = AsyncMock(return_value=sample_quote)
+
+        response = client.get(
+            "/api/quotes/507f1f77bcf86cd799439012", headers={"X-Request-ID": "req-1"}
+        )
+
+        assert response.headers["x-request-id"] == "req-1"
+        record = access_records[-1]
+        assert record.request_id == "req-1"
+        assert record.route == "/api/quotes/{quote_id}"
+        assert record.status == 200
+        assert record.latency_ms >= 0
+        assert record.mongo_ms == 0
+
+    def test_access_log_generates_request_id(self, client, access_records):
+        """Requests without an id header should get a generated one."""
+        response = client.get("/api/quotes/not-an-id")
+
+        assert len(response.headers["x-request-id"]) == 32
+        assert access_records[-1].status == 400
+        assert access_records[-1].levelno == logging.INFO
+
+    def test_mongo_time_from_motor_executor(self, access_records):
+        """Listener events raised on Motor's executor threads reach mongo_ms."""
+        listener = MongoTimingListener()
+        demo = FastAPI()
+
+        @demo.get("/query")
+        async def query() -> dict:
+            # Motor runs driver calls (and so listener callbacks) via run_on_executor
+            loop = asyncio.get_running_loop()
+            await run_on_executor(loop, listener.succeeded, MagicMock(duration_micros=2500))
+            await run_on_executor(loop, listener.failed, MagicMock(duration_micros=1500))
+            return {"ok": True}
+
+        demo.add_middleware(AccessLogMiddleware)
+        response = TestClient(demo).get("/query")
+
+        assert response.status_code == 200
+        assert access_records[-1].route == "/query"
+        assert access_records[-1].mongo_ms == 4.0
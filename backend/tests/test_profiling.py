@@ -0,0 +1,122 @@
+import asyncio
+import pstats
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.logs import AccessLogMiddleware
+from app.core.profiling import ProfilingMiddleware
+from app.main import app
+
+
+def _profiled_client(tmp_path, **options) -> TestClient:
+    """Build a tiny app wrapped in the profiling middleware."""
+    demo = FastAPI()
+
+    @demo.get("/work")
+    async def work() -> dict:
+        return {"total": sum(range(1000))}
+
+    @demo.get("/slow")
+    async def slow() -> dict:
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    demo.add_middleware(ProfilingMiddleware, output_dir=str(tmp_path), **options)
+    return TestClient(demo)
+
+
+class TestProfiling:
+    """Test the opt-in profiling middleware."""
+
+    def test_disabled_by_default(self):
+        """The main app should not install the profiler unless enabled."""
+        assert all(m.cls is not ProfilingMiddleware for m in app.user_middleware)
+
+    def test_no_header_not_profiled(self, tmp_path):
+        """Requests without the header should pass through untouched."""
+        response = _profiled_client(tmp_path, token="secret").get("/work")
+
+        assert response.status_code == 200
+        assert "x-profile-file" not in response.headers
+        assert list(tmp_path.iterdir()) == []
+
+    def test_wrong_token_not_profiled(self, tmp_path):
+        """A header with the wrong token should not trigger profiling."""
+        client = _profiled_client(tmp_path, token="secret")
+        response = client.get("/work", headers={"X-Profile": "guess"})
+
+        assert "x-profile-file" not in response.headers
+
+    def test_profile_written_to_file(self, tmp_path):
+        """A matching token should write a loadable pstats file."""
+        client = _profiled_client(tmp_path, token="secret")
+        response = client.get("/work", headers={"X-Profile": "secret"})
+
+        assert response.status_code == 200
+        assert response.json() == {"total": 499500}
+        profile = tmp_path / response.headers["x-profile-file"]
+        assert pstats.Stats(str(profile)).total_calls > 0
+        assert float(response.headers["x-profile-loop-blocked-ms"]) >= 0
+
+    def test_profile_inline(self, tmp_path):
+        """Inline output should replace the body with a text report."""
+        client = _profiled_client(tmp_path, token="secret")
+        response = client.get(
+            "/work", headers={"X-Profile": "secret", "X-Profile-Output": "inline"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["x-profile-status"] == "200"
+        assert "function calls" in response.text
+        assert list(tmp_path.iterdir()) == []
+
+    def test_sampling(self, tmp_path):
+        """A sample rate of 1 should profile every request."""
+        response = _profiled_client(tmp_path, sample_rate=1.0).get("/work")
+
+        assert "x-profile-file" in response.headers
+
+    def test_request_id_not_used_in_file_name(self, tmp_path):
+        """A traversal X-Request-ID must not escape the output directory."""
+        output_dir = tmp_path / "profiles"
+        client = _profiled_client(output_dir, sample_rate=1.0)
+        # As in the main app, the access log sets the request id from the header
+        client.app.add_middleware(AccessLogMiddleware)
+        response = client.get("/work", headers={"X-Request-ID": "../escaped"})
+
+        name = response.headers["x-profile-file"]
+        assert "/" not in name and ".." not in name
+        assert [p.name for p in output_dir.iterdir()] == [name]
+        assert [p.name for p in tmp_path.iterdir()] == ["profiles"]
+
+    def test_sampled_request_ignores_inline(self, tmp_path):
+        """Inline output needs the token; sampled requests keep their body."""
+        client = _profiled_client(tmp_path, token="secret", sample_rate=1.0)
+        response = client.get("/work", headers={"X-Profile-Output": "inline"})
+
+        assert response.json() == {"total": 499500}
+        assert "x-profile-status" not in response.headers
+        assert (tmp_path / response.headers["x-profile-file"]).exists()
+
+
+@pytest.mark.asyncio
+class TestProfilingConcurrency:
+    """Test that overlapping requests do not share a profiler."""
+
+    async def test_overlapping_requests_not_profiled_twice(self, tmp_path):
+        """A request arriving mid-profile should be served unprofiled."""
+        demo = _profiled_client(tmp_path, sample_rate=1.0).app
+        transport = httpx.ASGITransport(app=demo)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            slow_task = asyncio.create_task(client.get("/slow"))
+            await asyncio.sleep(0.01)
+            fast = await client.get("/work")
+            slow = await slow_task
+
+        assert slow.status_code == 200
+        assert fast.status_code == 200
+        assert "x-profile-file" in slow.headers
+        assert "x-profile-file" not in fast.headers
@@ -1,15 +1,18 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from datetime import datetime
 
+from bson import ObjectId
+
 
 @pytest.mark.asyncio
 class TestQuoteRoutes:
     """Test quote management routes."""
 
-    @patch("app.routers.quotes.db")
-    async def test_create_quote_success(self, mock_db, client):
+    @patch("app.routers.quotes.get_db")
+    async def test_create_quote_success(self, mock_get_db, client):
         """Successful quote creation should return quote ID."""
+        mock_db = mock_get_db.return_value
         mock_db.quotes.insert_one = AsyncMock()
         mock_db.quotes.insert_one.return_value.inserted_id = "507f1f77bcf86cd799439012"
         
@@ -27,6 +30,7 @@ class TestQuoteRoutes:
         assert response.status_code == 200
         assert response.json()["id"] == "507f1f77bcf86cd799439012"
         assert response.json()["message"] == "Quote request submitted successfully"
+        mock_get_db.assert_called_with("quote_ingest")
 
     def test_create_quote_missing_required_field(self, client):
         """Creating quote without required field should fail."""
@@ -69,14 +73,15 @@ class TestQuoteRoutes:
         
         assert response.status_code == 422
 
-    @patch("app.routers.quotes.db")
-    async def test_get_quotes_default_pagination(self, mock_db, client, sample_quote):
+    @patch("app.routers.quotes.get_db")
+    async def test_get_quotes_default_pagination(self, mock_get_db, client, sample_quote):
         """Get quotes with default pagination should work."""
+        mock_db = mock_get_db.return_value
         mock_db.quotes.count_documents = AsyncMock(return_value=1)
-        mock_db.quotes.find = AsyncMock()
-        mock_db.quotes.find.return_value.sort = AsyncMock()
-        mock_db.quotes.find.return_value.sort.return_value.skip = AsyncMock()
-        mock_db.quotes.find.return_value.sort.return_value.skip.return_value.limit = AsyncMock()
+        mock_db.quotes.find = MagicMock()
+        mock_db.quotes.find.return_value.sort = MagicMock()
+        mock_db.quotes.find.return_value.sort.return_value.skip = MagicMock()
+        mock_db.quotes.find.return_value.sort.return_value.skip.return_value.limit = MagicMock()
         
         # Mock the async iterator
         async def mock_async_iter(self):
@@ -93,14 +98,15 @@ class TestQuoteRoutes:
         assert data["pagination"]["page"] == 1
         assert data["pagination"]["limit"] == 10
 
-    @patch("app.routers.quotes.db")
-    async def test_get_quotes_custom_pagination(self, mock_db, client, sample_quote):
+    @patch("app.routers.quotes.get_db")
+    async def test_get_quotes_custom_pagination(self, mock_get_db, client, sample_quote):
         """Get quotes with custom page and limit should work."""
+        mock_db = mock_get_db.return_value
         mock_db.quotes.count_documents = AsyncMock(return_value=25)
-        mock_db.quotes.find = AsyncMock()
-        mock_db.quotes.find.return_value.sort = AsyncMock()
-        mock_db.quotes.find.return_value.sort.return_value.skip = AsyncMock()
-        mock_db.quotes.find.return_value.sort.return_value.skip.return_value.limit = AsyncMock()
+        mock_db.quotes.find = MagicMock()
+        mock_db.quotes.find.return_value.sort = MagicMock()
+        mock_db.quotes.find.return_value.sort.return_value.skip = MagicMock()
+        mock_db.quotes.find.return_value.sort.return_value.skip.return_value.limit = MagicMock()
         
         async def mock_async_iter(self):
             yield sample_quote
@@ -118,6 +124,41 @@ class TestQuoteRoutes:
         assert data["pagination"]["hasNext"] is True
         assert data["pagination"]["hasPrev"] is True
 
+    @patch("app.routers.quotes.get_db")
+    async def test_get_quotes_sort_and_filter(self, mock_get_db, client, sample_quote):
+        """Sorting and filter parameters should be applied in the query."""
+        mock_db = mock_get_db.return_value
+        mock_db.quotes.count_documents = AsyncMock(return_value=1)
+
+        async def mock_async_iter(self):
+            yield sample_quote
+
+        cursor = mock_db.quotes.find.return_value.sort.return_value.skip.return_value
+        cursor.limit.return_value.__aiter__ = mock_async_iter
+
+        response = client.get(
+            "/api/quotes?sort=createdAt&order=asc&status=PENDING&serviceType=plumbing&name=jo.n"
+        )
+
+        assert response.status_code == 200
+        expected = {
+            "status": "PENDING",
+            "serviceType": "plumbing",
+            "name": {"$regex": "jo\\.n", "$options": "i"},
+        }
+        mock_db.quotes.count_documents.assert_awaited_once_with(expected)
+        mock_db.quotes.find.assert_called_once_with(expected)
+        mock_db.quotes.find.return_value.sort.assert_called_once_with(
+            [("createdAt", 1), ("_id", 1)]
+        )
+        mock_get_db.assert_called_with("listing")
+
+    def test_get_quotes_invalid_sort(self, client):
+        """Sorting by an unindexed field should fail validation."""
+        response = client.get("/api/quotes?sort=name")
+
+        assert response.status_code == 422
+
     def test_get_quotes_invalid_page(self, client):
         """Get quotes with invalid page should fail validation."""
         response = client.get("/api/quotes?page=0")
@@ -130,9 +171,10 @@ class TestQuoteRoutes:
         
         assert response.status_code == 422
 
-    @patch("app.routers.quotes.db")
-    async def test_create_quote_database_error(self, mock_db, client):
+    @patch("app.routers.quotes.get_db")
+    async def test_create_quote_database_error(self, mock_get_db, client):
         """Quote creation should handle database errors."""
+        mock_db = mock_get_db.return_value
         mock_db.quotes.insert_one = AsyncMock(side_effect=Exception("DB error"))
         
         response = client.post(
@@ -148,12 +190,300 @@ class TestQuoteRoutes:
         assert response.status_code == 500
         assert "Failed to create quote" in response.json()["detail"]
 
-    @patch("app.routers.quotes.db")
-    async def test_get_quotes_database_error(self, mock_db, client):
+    @patch("app.routers.quotes.get_db")
+    async def test_get_quotes_database_error(self, mock_get_db, client):
         """Get quotes should handle database errors."""
+        mock_db = mock_get_db.return_value
         mock_db.quotes.count_documents = AsyncMock(side_effect=Exception("DB error"))
         
         response = client.get("/api/quotes")
         
         assert response.status_code == 500
         assert "Failed to fetch quotes" in response.json()["detail"]
+
+    @patch("app.routers.quotes.get_db")
+    async def test_get_quote_by_id(self, mock_get_db, client, sample_quote):
+        """Get quote by id should return the serialized quote."""
+        mock_db = mock_get_db.return_value
+        mock_db.quotes.find_one = AsyncMock(return_value=sample_quote)
+
+        response = client.get("/api/quotes/507f1f77bcf86cd799439012")
+
+        assert response.status_code == 200
+        assert response.json()["id"] == "507f1f77bcf86cd799439012"
+        assert response.json()["serviceType"] == "plumbing"
+
+    @patch("app.routers.quotes.get_db")
+    async def test_get_quote_not_found(self, mock_get_db, client):
+        """Get quote with unknown id should return 404."""
+        mock_db = mock_get_db.return_value
+        mock_db.quotes.find_one = AsyncMock(return_value=None)
+
+        response = client.get("/api/quotes/507f1f77bcf86cd799439099")
+
+        assert response.status_code == 404
+
+    def test_get_quote_invalid_id(self, client):
+        """Get quote with malformed id should return 400."""
+        response = client.get("/api/quotes/not-an-id")
+
+        assert response.status_code == 400
+
+    @patch("app.routers.quotes.get_db")
+    async def test_batch_get_preserves_order(self, mock_get_db, client, sample_quote):
+        """Batch get should return quotes in input order and list missing ids."""
+        mock_db = mock_get_db.return_value
+        first = {**sample_quote, "_id": ObjectId("507f1f77bcf86cd799439012")}
+        other = {**sample_quote, "_id": ObjectId("507f1f77bcf86cd799439013"), "name": "Jane Roe"}
+
+        async def mock_async_iter(self):
+            yield first
+            yield other
+
+        mock_db.quotes.find.return_value.__aiter__ = mock_async_iter
+
+        ids = [
+            "507f1f77bcf86cd799439013",
+            "507f1f77bcf86cd799439099",
+            "507f1f77bcf86cd799439012",
+            "507f1f77bcf86cd799439013",
+        ]
+        response = client.post("/api/quotes/batch-get", json={"ids": ids})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [q["id"] for q in data["quotes"]] == [ids[0], ids[2]]
+        assert data["missing"] == [ids[1]]
+        query, projection = mock_db.quotes.find.call_args.args
+        assert len(query["_id"]["$in"]) == 3
+        assert projection is None
+        mock_get_db.assert_called_with()
+
+    @patch("app.routers.quotes.get_db")
+    async def test_batch_get_uppercase_ids(self, mock_get_db, client, sample_quote):
+        """Uppercase ids should match stored quotes and dedupe with lowercase."""
+        mock_db = mock_get_db.return_value
+
+        async def mock_async_iter(self):
+            yield {**sample_quote, "_id": ObjectId("507f1f77bcf86cd799439012")}
+
+        mock_db.quotes.find.return_value.__aiter__ = mock_async_iter
+
+        ids = ["507F1F77BCF86CD799439012", "507f1f77bcf86cd799439012"]
+        response = client.post("/api/quotes/batch-get", json={"ids": ids})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [q["id"] for q in data["quotes"]] == ["507f1f77bcf86cd799439012"]
+        assert data["missing"] == []
+        query = mock_db.quotes.find.call_args.args[0]
+        assert len(query["_id"]["$in"]) == 1
+
+    @patch("app.routers.quotes.get_db")
+    async def test_batch_get_with_projection(self, mock_get_db, client):
+        """Batch get with fields should project at the database."""
+        mock_db = mock_get_db.return_value
+        async def mock_async_iter(self):
+            yield {"_id": ObjectId("507f1f77bcf86cd799439012"), "status": "PENDING"}
+
+        mock_db.quotes.find.return_value.__aiter__ = mock_async_iter
+
+        response = client.post(
+            "/api/quotes/batch-get",
+            json={"ids": ["507f1f77bcf86cd799439012"], "fields": ["status"]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["quotes"] == [
+            {"id": "507f1f77bcf86cd799439012", "status": "PENDING"}
+        ]
+        assert mock_db.quotes.find.call_args.args[1] == {"status": 1}
+
+    def test_batch_get_unknown_field(self, client):
+        """Batch get with an unknown projection field should return 400."""
+        response = client.post(
+            "/api/quotes/batch-get",
+            json={"ids": ["507f1f77bcf86cd799439012"], "fields": ["hashed_password"]},
+        )
+
+        assert response.status_code == 400
+
+    def test_batch_get_invalid_id(self, client):
+        """Batch get with a malformed id should return 400."""
+        response = client.post("/api/quotes/batch-get", json={"ids": ["nope"]})
+
+        assert response.status_code == 400
+
+    def test_batch_get_too_many_ids(self, client):
+        """Batch get over the id limit should fail validation."""
+        ids = ["507f1f77bcf86cd799439012"] * 101
+        response = client.post("/api/quotes/batch-get", json={"ids": ids})
+
+        assert response.status_code == 422
+
+    @patch("app.routers.quotes.get_db")
+    async def test_update_status_success(self, mock_get_db, client, sample_quote):
+        """Valid transition should update status and updatedAt."""
+        mock_db = mock_get_db.return_value
+        updated = {**sample_quote, "status": "IN_PROGRESS", "updatedAt": datetime.utcnow()}
+        mock_db.quotes.find_one_and_update = AsyncMock(return_value=updated)
+
+        response = client.patch(
+            "/api/quotes/507f1f77bcf86cd799439012/status",
+            json={"status": "IN_PROGRESS", "expectedStatus": "PENDING"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "IN_PROGRESS"
+        query, update = mock_db.quotes.find_one_and_update.call_args.args
+        assert query["status"] == "PENDING"
+        assert update["$set"]["status"] == "IN_PROGRESS"
+        assert "updatedAt" in update["$set"]
+
+    def test_update_status_invalid_transition(self, client):
+        """Disallowed transition should return 400 without touching the DB."""
+        response = client.patch(
+            "/api/quotes/507f1f77bcf86cd799439012/status",
+            json={"status": "PENDING", "expectedStatus": "COMPLETED"},
+        )
+
+        assert response.status_code == 400
+
+    @patch("app.routers.quotes.get_db")
+    async def test_update_status_conflict(self, mock_get_db, client, sample_quote):
+        """Stale expected status should return 409."""
+        mock_db = mock_get_db.return_value
+        mock_db.quotes.find_one_and_update = AsyncMock(return_value=None)
+        mock_db.quotes.find_one = AsyncMock(return_value={"_id": sample_quote["_id"]})
+
+        response = client.patch(
+            "/api/quotes/507f1f77bcf86cd799439012/status",
+            json={"status": "COMPLETED", "expectedStatus": "IN_PROGRESS"},
+        )
+
+        assert response.status_code == 409
+
+    @patch("app.routers.quotes.get_db")
+    async def test_update_status_not_found(self, mock_get_db, client):
+        """Updating a missing quote should return 404."""
+        mock_db = mock_get_db.return_value
+        mock_db.quotes.find_one_and_update = AsyncMock(return_value=None)
+        mock_db.quotes.find_one = AsyncMock(return_value=None)
+
+        response = client.patch(
+            "/api/quotes/507f1f77bcf86cd799439099/status",
+            json={"status": "COMPLETED", "expectedStatus": "IN_PROGRESS"},
+        )
+
+        assert response.status_code == 404
+
+    @patch("app.routers.quotes.get_db")
+    async def test_bulk_status_all_applied(self, mock_get_db, client):
+        """Bulk update should issue one unordered bulk_write."""
+        mock_db = mock_get_db.return_value
+        mock_db.quotes.bulk_write = AsyncMock()
+        mock_db.quotes.bulk_write.return_value.matched_count = 2
+
+        response = client.post(
+            "/api/quotes/status:bulk",
+            json={
+                "updates": [
+                    {"id": "507f1f77bcf86cd799439012", "status": "IN_PROGRESS", "expectedStatus": "PENDING"},
+                    {"id": "507f1f77bcf86cd799439013", "status": "COMPLETED", "expectedStatus": "IN_PROGRESS"},
+                    {"id": "507f1f77bcf86cd799439014", "status": "PENDING", "expectedStatus": "CANCELLED"},
+                    {"id": "bad-id", "status": "COMPLETED", "expectedStatus": "IN_PROGRESS"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["result"] for r in data["results"]] == [
+            "updated",
+            "updated",
+            "invalid_transition",
+            "invalid_id",
+        ]
+        assert data["updated"] == 2
+        operations = mock_db.quotes.bulk_write.call_args.args[0]
+        assert len(operations) == 2
+        assert mock_db.quotes.bulk_write.call_args.kwargs["ordered"] is False
+
+    @patch("app.routers.quotes.get_db")
+    async def test_bulk_status_partial_conflict(self, mock_get_db, client):
+        """Bulk update should report conflicts for writes that did not match."""
+        mock_db = mock_get_db.return_value
+        mock_db.quotes.bulk_write = AsyncMock()
+        mock_db.quotes.bulk_write.return_value.matched_count = 1
+
+        async def mock_async_iter(self):
+            yield {"_id": "507f1f77bcf86cd799439013", "status": "COMPLETED"}
+
+        mock_db.quotes.find.return_value.__aiter__ = mock_async_iter
+
+        response = client.post(
+            "/api/quotes/status:bulk",
+            json={
+                "updates": [
+                    {"id": "507f1f77bcf86cd799439012", "status": "IN_PROGRESS", "expectedStatus": "PENDING"},
+                    {"id": "507f1f77bcf86cd799439013", "status": "COMPLETED", "expectedStatus": "IN_PROGRESS"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert [r["result"] for r in response.json()["results"]] == ["conflict", "updated"]
+        batch_id = mock_db.quotes.bulk_write.call_args.args[0][0]._doc["$set"]["statusBatchId"]
+        query = mock_db.quotes.find.call_args.args[0]
+        assert query["statusBatchId"] == batch_id
+        assert "updatedAt" not in query
+
+    @patch("app.routers.quotes.get_db")
+    async def test_bulk_status_uppercase_id_applied(self, mock_get_db, client):
+        """Uppercase ids whose write landed should be reported as updated."""
+        mock_db = mock_get_db.return_value
+        mock_db.quotes.bulk_write = AsyncMock()
+        mock_db.quotes.bulk_write.return_value.matched_count = 1
+
+        async def mock_async_iter(self):
+            yield {"_id": "507f1f77bcf86cd799439013", "status": "COMPLETED"}
+
+        mock_db.quotes.find.return_value.__aiter__ = mock_async_iter
+
+        response = client.post(
+            "/api/quotes/status:bulk",
+            json={
+                "updates": [
+                    {"id": "507f1f77bcf86cd799439012", "status": "IN_PROGRESS", "expectedStatus": "PENDING"},
+                    {"id": "507F1F77BCF86CD799439013", "status": "COMPLETED", "expectedStatus": "IN_PROGRESS"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {"id": "507f1f77bcf86cd799439012", "result": "conflict"},
+            {"id": "507f1f77bcf86cd799439013", "result": "updated"},
+        ]
+
+    def test_bulk_status_duplicate_ids_differing_case(self, client):
+        """Different casings of one id should count as duplicates."""
+        item = {"status": "IN_PROGRESS", "expectedStatus": "PENDING"}
+        response = client.post(
+            "/api/quotes/status:bulk",
+            json={
+                "updates": [
+                    {**item, "id": "507f1f77bcf86cd799439012"},
+                    {**item, "id": "507F1F77BCF86CD799439012"},
+                ]
+            },
+        )
+
+        assert response.status_code == 400
+
+    def test_bulk_status_duplicate_ids(self, client):
+        """Bulk update with repeated ids should return 400."""
+        item = {"id": "507f1f77bcf86cd799439012", "status": "IN_PROGRESS", "expectedStatus": "PENDING"}
+        response = client.post("/api/quotes/status:bulk", json={"updates": [item, item]})
+
+        assert response.status_code == 400
@@ -0,0 +1,83 @@
+from app import server
+from app.config import Settings
+from app.server import cgroup_cpu_limit, uvicorn_options, worker_count
+
+
+class TestServerOptions:
+    """Test uvicorn options derived from settings."""
+
+    def test_development_mode_reloads_single_worker(self):
+        """Development mode should auto-reload without extra workers."""
+        options = uvicorn_options(Settings())
+
+        assert options["reload"] is True
+        assert "workers" not in options
+        assert options["port"] == 8001
+
+    def test_production_mode_options(self):
+        """Production mode should use uvloop/httptools and tuned settings."""
+        settings = Settings(
+            SERVER_MODE="production",
+            WEB_CONCURRENCY=3,
+            KEEPALIVE_TIMEOUT=10,
+            BACKLOG=4096,
+        )
+        options = uvicorn_options(settings)
+
+        assert "reload" not in options
+        assert options["workers"] == 3
+        assert options["loop"] == "auto"
+        assert options["http"] == "httptools"
+        assert options["timeout_keep_alive"] == 10
+        assert options["backlog"] == 4096
+        assert options["timeout_graceful_shutdown"] == 8
+
+    def test_worker_count_defaults_to_cpus(self):
+        """Worker count should fall back to the available CPUs."""
+        assert worker_count(Settings()) >= 1
+
+    def test_cgroup_v2_quota(self, tmp_path, monkeypatch):
+        """A cgroup v2 quota should be rounded up to whole CPUs."""
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+        monkeypatch.setattr(server, "CGROUP_V2_CPU_MAX", str(cpu_max))
+
+        assert cgroup_cpu_limit() == 2
+
+    def test_cgroup_v2_unlimited(self, tmp_path, monkeypatch):
+        """An unlimited cgroup v2 quota should not cap workers."""
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("max 100000\n")
+        monkeypatch.setattr(server, "CGROUP_V2_CPU_MAX", str(cpu_max))
+
+        assert cgroup_cpu_limit() is None
+
+    def test_cgroup_v1_quota(self, tmp_path, monkeypatch):
+        """cgroup v1 quota and period files should be read as a fallback."""
+        (tmp_path / "quota").write_text("50000\n")
+        (tmp_path / "period").write_text("100000\n")
+        monkeypatch.setattr(server, "CGROUP_V2_CPU_MAX", str(tmp_path / "missing"))
+        monkeypatch.setattr(server, "CGROUP_V1_QUOTA", str(tmp_path / "quota"))
+        monkeypatch.setattr(server, "CGROUP_V1_PERIOD", str(tmp_path / "period"))
+
+        assert cgroup_cpu_limit() == 1
+
+    def test_worker_count_capped_by_quota(self, monkeypatch):
+        """Worker count should not exceed the container CPU quota."""
+        monkeypatch.setattr(server, "cgroup_cpu_limit", lambda: 1)
+
+        assert worker_count(Settings()) == 1
+
+    def test_settings_read_environment(self, monkeypatch):
+        """Settings should be overridable through environment variables."""
+        monkeypatch.setenv("SERVER_MODE", "production")
+        monkeypatch.setenv("WEB_CONCURRENCY", "2")
+        from app.config import get_settings
+
+        get_settings.cache_clear()
+        try:
+            settings = get_settings()
+            assert settings.server_mode == "production"
+            assert settings.web_concurrency == 2
+        finally:
+            get_settings.cache_clear()
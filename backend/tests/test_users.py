@@ -6,9 +6,10 @@ import pytest
 class TestUserRoutes:
     """Test user management routes."""
 
-    @patch("app.routers.users.db")
-    async def test_create_user_success(self, mock_db, client):
+    @patch("app.routers.users.get_db")
+    async def test_create_user_success(self, mock_get_db, client):
         """Successful user creation should return user data."""
+        mock_db = mock_get_db.return_value
         mock_db.users.find_one = AsyncMock(return_value=None)
         mock_db.users.insert_one = AsyncMock()
         mock_db.users.insert_one.return_value.inserted_id = "507f1f77bcf86cd799439011"
@@ -23,9 +24,10 @@ class TestUserRoutes:
         assert response.json()["email"] == "newuser@example.com"
         mock_db.users.insert_one.assert_called_once()
 
-    @patch("app.routers.users.db")
-    async def test_create_user_duplicate_email(self, mock_db, client, sample_user):
+    @patch("app.routers.users.get_db")
+    async def test_create_user_duplicate_email(self, mock_get_db, client, sample_user):
         """Creating user with existing email should return 400."""
+        mock_db = mock_get_db.return_value
         mock_db.users.find_one = AsyncMock(return_value=sample_user)
         
         response = client.post(
@@ -64,9 +66,10 @@ class TestUserRoutes:
         
         assert response.status_code == 422
 
-    @patch("app.routers.users.db")
-    async def test_create_user_database_error(self, mock_db, client):
+    @patch("app.routers.users.get_db")
+    async def test_create_user_database_error(self, mock_get_db, client):
         """User creation should handle database errors."""
+        mock_db = mock_get_db.return_value
         mock_db.users.find_one = AsyncMock(return_value=None)
         mock_db.users.insert_one = AsyncMock(side_effect=Exception("DB error"))
         
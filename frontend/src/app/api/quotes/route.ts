@@ -1,16 +1,50 @@
-export async function GET() {
-  const res = await fetch(
-    `${process.env.FASTAPI_URL}/api/quotes`,
-    { cache: 'no-store' }
-  )
+import { after, type NextRequest } from 'next/server'
+
+// Query parameters the FastAPI listing endpoint understands
+const FORWARDED_PARAMS = ['page', 'limit', 'sort', 'order', 'status', 'serviceType', 'name']
+
+// Listing responses are cached briefly; operators tolerate a few seconds of lag
+const REVALIDATE_SECONDS = 5
+
+function quotesUrl(params: URLSearchParams) {
+  return `${process.env.FASTAPI_URL}/api/quotes?${params.toString()}`
+}
+
+export async function GET(request: NextRequest) {
+  const params = new URLSearchParams()
+  for (const key of FORWARDED_PARAMS) {
+    const value = request.nextUrl.searchParams.get(key)
+    if (value) params.set(key, value)
+  }
+  params.sort() // Stable cache keys regardless of parameter order
+
+  const res = await fetch(quotesUrl(params), {
+    next: { revalidate: REVALIDATE_SECONDS },
+  })
 
   if (!res.ok) {
     return Response.json(
       { message: 'Failed to fetch quotes' },
-      { status: 500 }
+      { status: res.status === 422 ? 400 : 500 }
     )
   }
 
   const data = await res.json()
-  return Response.json(data)
+
+  // Warm the cache for the page the operator is most likely to open next;
+  // after() keeps this running once the response has been sent
+  if (data?.pagination?.hasNext) {
+    const next = new URLSearchParams(params)
+    next.set('page', String(data.pagination.page + 1))
+    next.sort()
+    after(async () => {
+      await fetch(quotesUrl(next), { next: { revalidate: REVALIDATE_SECONDS } }).catch(() => {})
+    })
+  }
+
+  return Response.json(data, {
+    headers: {
+      'Cache-Control': `private, max-age=${REVALIDATE_SECONDS}, stale-while-revalidate=30`,
+    },
+  })
 }
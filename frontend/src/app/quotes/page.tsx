@@ -2,30 +2,78 @@
 
 import QuotesTable from '@/components/QuotesTable';
 import { fetchQuotes } from '@/features/quotes/client';
-import { Quote } from '@/types/Quote';
+import { Quote, QuotesQuery } from '@/types/Quote';
 import {
   Alert,
   Container,
   Typography,
 } from '@mui/material';
+import { GridFilterModel, GridPaginationModel, GridSortModel } from '@mui/x-data-grid';
 import { useEffect, useState } from 'react';
 
 const API_BASE = process.env.NEXT_PUBLIC_API_BASE_URL || 'http://localhost:8001';
 
+// Grid filter items the API supports, keyed by field and operator
+const FILTER_PARAMS: Record<string, { operator: string; param: keyof QuotesQuery }> = {
+  name: { operator: 'contains', param: 'name' },
+  serviceType: { operator: 'equals', param: 'serviceType' },
+  status: { operator: 'is', param: 'status' },
+};
+
+function toQuery(
+  pagination: GridPaginationModel,
+  sort: GridSortModel,
+  filter: GridFilterModel,
+): QuotesQuery {
+  const query: QuotesQuery = { page: pagination.page + 1, limit: pagination.pageSize };
+
+  const [primary] = sort;
+  if (primary?.sort) {
+    query.sort = primary.field;
+    query.order = primary.sort;
+  }
+
+  for (const item of filter.items) {
+    const mapping = FILTER_PARAMS[item.field];
+    if (mapping && item.operator === mapping.operator && item.value) {
+      Object.assign(query, { [mapping.param]: String(item.value) });
+    }
+  }
+  return query;
+}
+
 export default function QuotesPage() {
   const [rows, setRows] = useState<Quote[]>([]);
+  const [rowCount, setRowCount] = useState(0);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const [paginationModel, setPaginationModel] = useState<GridPaginationModel>({ page: 0, pageSize: 25 });
+  const [sortModel, setSortModel] = useState<GridSortModel>([{ field: 'createdAt', sort: 'desc' }]);
+  const [filterModel, setFilterModel] = useState<GridFilterModel>({ items: [] });
 
  useEffect(() => {
+  const controller = new AbortController()
   setLoading(true)
   setError(null)
 
-  fetchQuotes()
-    .then(setRows)
-    .catch(err => setError(err.message ?? 'Unknown error'))
-    .finally(() => setLoading(false))
-}, [])
+  fetchQuotes(toQuery(paginationModel, sortModel, filterModel), controller.signal)
+    .then(({ quotes, pagination }) => {
+      setRows(quotes)
+      setRowCount(pagination.total)
+    })
+    .catch(err => {
+      if (err.name !== 'AbortError') setError(err.message ?? 'Unknown error')
+    })
+    .finally(() => {
+      if (!controller.signal.aborted) setLoading(false)
+    })
+
+  // Drop responses for pages the operator has already moved past
+  return () => controller.abort()
+}, [paginationModel, sortModel, filterModel])
+
+  // A new sort or filter changes the result set, so start from the first page
+  const resetPage = () => setPaginationModel(model => ({ ...model, page: 0 }))
 
   return (
     <Container maxWidth="lg" sx={{ py: 4 }}>
@@ -41,7 +89,23 @@ export default function QuotesPage() {
           {error}
         </Alert>
       )}
-      <QuotesTable rows={rows} loading={loading} />
+      <QuotesTable
+        rows={rows}
+        rowCount={rowCount}
+        loading={loading}
+        paginationModel={paginationModel}
+        onPaginationModelChange={setPaginationModel}
+        sortModel={sortModel}
+        onSortModelChange={model => {
+          setSortModel(model)
+          resetPage()
+        }}
+        filterModel={filterModel}
+        onFilterModelChange={model => {
+          setFilterModel(model)
+          resetPage()
+        }}
+      />
     </Container>
   );
 }
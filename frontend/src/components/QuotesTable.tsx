@@ -1,16 +1,36 @@
 import { Quote } from "@/types/Quote";
 import { Box } from "@mui/material";
-import { DataGrid, GridColDef } from "@mui/x-data-grid";
+import {
+  DataGrid,
+  GridColDef,
+  GridFilterModel,
+  GridPaginationModel,
+  GridSortModel,
+  getGridSingleSelectOperators,
+  getGridStringOperators,
+} from "@mui/x-data-grid";
+
+export const QUOTE_STATUSES = ['SUBMITTED', 'PENDING', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED'];
+
+// Only offer the sorts and filters the API can serve from an index
+// (createdAt sort; name "contains" is a regex scan within the other filters)
+const containsOperator = getGridStringOperators().filter((op) => op.value === 'contains');
+const equalsOperator = getGridStringOperators().filter((op) => op.value === 'equals');
+const isOperator = getGridSingleSelectOperators().filter((op) => op.value === 'is');
 
 const columns: GridColDef[] = [
-    { field: 'name', headerName: 'Name', flex: 1, minWidth: 150 },
-    { field: 'phone', headerName: 'Phone', flex: 1, minWidth: 140 },
-    { field: 'serviceType', headerName: 'Service Type', flex: 1, minWidth: 140 },
+    { field: 'name', headerName: 'Name', flex: 1, minWidth: 150, sortable: false, filterOperators: containsOperator },
+    { field: 'phone', headerName: 'Phone', flex: 1, minWidth: 140, sortable: false, filterable: false },
+    { field: 'serviceType', headerName: 'Service Type', flex: 1, minWidth: 140, sortable: false, filterOperators: equalsOperator },
     {
       field: 'status',
       headerName: 'Status',
       flex: 1,
       minWidth: 120,
+      sortable: false,
+      type: 'singleSelect',
+      valueOptions: QUOTE_STATUSES,
+      filterOperators: isOperator,
       valueGetter: (value) => value ?? 'SUBMITTED',
     },
     {
@@ -18,14 +38,38 @@ const columns: GridColDef[] = [
       headerName: 'Created At',
       flex: 1,
       minWidth: 180,
+      filterable: false,
       valueFormatter: (value) => 
         value ? new Date(value as string).toLocaleString() : '—',
     },
-    { field: 'address', headerName: 'Address', flex: 2, minWidth: 200 },
-    { field: 'description', headerName: 'Description', flex: 2, minWidth: 220 },
+    { field: 'address', headerName: 'Address', flex: 2, minWidth: 200, sortable: false, filterable: false },
+    { field: 'description', headerName: 'Description', flex: 2, minWidth: 220, sortable: false, filterable: false },
   ];
 
-export default function QuotesTable({ rows, loading }: { rows: Quote[]; loading: boolean }) {
+interface QuotesTableProps {
+  rows: Quote[];
+  rowCount: number;
+  loading: boolean;
+  paginationModel: GridPaginationModel;
+  onPaginationModelChange: (model: GridPaginationModel) => void;
+  sortModel: GridSortModel;
+  onSortModelChange: (model: GridSortModel) => void;
+  filterModel: GridFilterModel;
+  onFilterModelChange: (model: GridFilterModel) => void;
+}
+
+export default function QuotesTable({
+  rows,
+  rowCount,
+  loading,
+  paginationModel,
+  onPaginationModelChange,
+  sortModel,
+  onSortModelChange,
+  filterModel,
+  onFilterModelChange,
+}: QuotesTableProps) {
+  // Fixed height keeps DataGrid row virtualization active for large pages
   return <Box sx={{ height: 640, width: '100%' }}>
         <DataGrid
           rows={rows}
@@ -33,10 +77,18 @@ export default function QuotesTable({ rows, loading }: { rows: Quote[]; loading:
           getRowId={(row) => row.id}
           loading={loading}
           disableRowSelectionOnClick
-          initialState={{
-            pagination: { paginationModel: { pageSize: 10, page: 0 } },
-          }}
-          pageSizeOptions={[10, 25, 50]}
+          paginationMode="server"
+          sortingMode="server"
+          filterMode="server"
+          rowCount={rowCount}
+          paginationModel={paginationModel}
+          onPaginationModelChange={onPaginationModelChange}
+          sortModel={sortModel}
+          onSortModelChange={onSortModelChange}
+          filterModel={filterModel}
+          onFilterModelChange={onFilterModelChange}
+          filterDebounceMs={400}
+          pageSizeOptions={[25, 50, 100]}
         />
       </Box>;
-}
\ No newline at end of file
+}
@@ -1,10 +1,27 @@
-export async function fetchQuotes() {
-  const res = await fetch('/api/quotes')
+import { QuotesPage, QuotesQuery } from '@/types/Quote'
+
+export async function fetchQuotes(query: QuotesQuery, signal?: AbortSignal): Promise<QuotesPage> {
+  const params = new URLSearchParams()
+  for (const [key, value] of Object.entries(query)) {
+    if (value !== undefined && value !== '') params.set(key, String(value))
+  }
+
+  const res = await fetch(`/api/quotes?${params.toString()}`, { signal })
 
   if (!res.ok) {
     throw new Error('Failed to fetch quotes')
   }
 
   const data = await res.json()
-  return Array.isArray(data?.quotes) ? data.quotes : []
+  return {
+    quotes: Array.isArray(data?.quotes) ? data.quotes : [],
+    pagination: data?.pagination ?? {
+      page: query.page,
+      limit: query.limit,
+      total: 0,
+      totalPages: 0,
+      hasNext: false,
+      hasPrev: false,
+    },
+  }
 }
@@ -7,4 +7,29 @@ export interface Quote {
   description?: string;
   status?: string;
   createdAt?: string;
-}
\ No newline at end of file
+  updatedAt?: string;
+}
+
+export interface QuotesPagination {
+  page: number;
+  limit: number;
+  total: number;
+  totalPages: number;
+  hasNext: boolean;
+  hasPrev: boolean;
+}
+
+export interface QuotesPage {
+  quotes: Quote[];
+  pagination: QuotesPagination;
+}
+
+export interface QuotesQuery {
+  page: number;
+  limit: number;
+  sort?: string;
+  order?: 'asc' | 'desc';
+  status?: string;
+  serviceType?: string;
+  name?: string;
+}